@@ -1,6 +1,102 @@
 import re
 import os
 import sys
+import string
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+# 技术词汇列表
+technical_keywords = [
+    '1080p', '720p', '2160p', 'x265', 'x264', 'ac3', 'flac', 'hevc', 'ma10p', 
+    'web-dl', 'bdrip', 'webrip', 'big5', 'hi10p', 'aac', 'avc', 'web', 'multisub', 'multi-subs','1080','1920'
+]
+
+# 预编译的正则表达式（模块加载时编译一次，避免每个文件重复编译）
+# 需要忽略大小写的正则均写成小写形式，匹配小写化后的文本，避免 re.IGNORECASE 的逐字符大小写折叠
+_BRACKET_HASH_RE = re.compile(r'\[[a-zA-Z0-9]{8}\]')  # 匹配 [8位字母数字]
+_EMPTY_BRACKETS_RE = re.compile(r'\[\s*\]')  # 匹配空的方括号
+_MULTISPACE_RE = re.compile(r'\s{2,}')  # 匹配多余的空格
+_SEASON_RE = re.compile(r'([Ss]eason\s*(\d+)|[Ss](\d+))')  # 匹配 "Season 1", "S01", 或 "s2"
+_SEASON_OR_EP_RE = re.compile(r'\b(season\s*\d{1,2}|s\d{1,2}|ep?\d{1,2}|\d{1,2})\b')  # 匹配季信息或集信息，例如 "S2", "Season 02", "Ep10", "10"
+# 集数的各种格式合并为一个正则，一次扫描即可找出所有候选，按 _EPISODE_PRIORITY 的顺序选取
+_EPISODE_RE = re.compile(
+    r'ep?(?P<ep>\d{1,2})'                 # 匹配 "Ep10", "E03"
+    r'|\b第(?P<ch>\d{1,2})话\b'             # 匹配 "第10话"
+    r'|\b(?P<rng>\d{1,2})-\d{1,2}\b'        # 匹配范围 "01-02"，提取第一个数字
+    r'|\b(?P<num>\d{1,2})\b'                # 匹配纯数字 "01"
+)
+_EPISODE_PRIORITY = ('ch', 'rng', 'num')  # "ep" 优先级最高，匹配到即返回
+# 所有技术词汇合并为一个正则（按长度降序排列，保证 "1080p" 优先于 "1080" 匹配），一次扫描即可全部移除
+_TECH_RE = re.compile(
+    '(?:' + '|'.join(re.escape(k.lower()) for k in sorted(technical_keywords, key=len, reverse=True)) + ')'
+)
+_SEP_TABLE = str.maketrans({c: '|' for c in '.-_[]()&/'})  # 常见分隔符统一替换为 "|"
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)  # 仅将 ASCII 字母转为小写
+
+# 日志缓冲区，累计一定条数后一次性写入 stdout，避免每个文件都 print 一次
+_LOG_BATCH_SIZE = 1000
+_log_buffer = []
+
+# 并行重命名的线程数（重命名是 I/O 操作，线程数可以多于 CPU 核数）
+_RENAME_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _lower(text: str):
+    """
+    将文本转为小写，并保证字符位置与原文本一一对应。
+
+    参数：
+    text (str): 原文本
+
+    返回：
+    str: 小写化的文本
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # 个别字符（如 "İ"）小写后长度会变化，此时只转换 ASCII 字母以保证位置一致
+        lowered = text.translate(_ASCII_LOWER_TABLE)
+    return lowered
+
+def _remove_matches(pattern, text: str):
+    """
+    在小写化的文本上匹配小写正则，再按匹配位置从原文本中删除匹配部分，保留原有大小写。
+
+    参数：
+    pattern (re.Pattern): 小写形式的正则
+    text (str): 原文本
+
+    返回：
+    str: 删除匹配部分后的文本
+    """
+    pieces = []
+    last = 0
+    for match in pattern.finditer(_lower(text)):
+        pieces.append(text[last:match.start()])
+        last = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+def remove_technical_keywords_and_noise(text: str):
+    """
+    修剪文件名中的技术词汇和噪声（哈希值、空方括号、多余空格）。
+
+    参数：
+    text (str): 原始文件名
+
+    返回：
+    str: 修剪后的文件名
+    """
+    # 移除 [8位字母数字] 的部分
+    text = _BRACKET_HASH_RE.sub('', text)
+    # 移除技术词汇（忽略大小写）
+    text = _remove_matches(_TECH_RE, text)
+    # 替换空的方括号为 "[]"
+    text = _EMPTY_BRACKETS_RE.sub('[]', text)
+    # 清理多余的空格
+    text = _MULTISPACE_RE.sub(' ', text).strip()
+    return text
 
 def preprocess_filename(filename: str):
     """
@@ -15,62 +111,46 @@ def preprocess_filename(filename: str):
     # 1. 保存原文件名
     ori_filename = filename
 
-    # 2. 定义技术词汇列表
-    technical_keywords = [
-        '1080p', '720p', '2160p', 'x265', 'x264', 'ac3', 'flac', 'hevc', 'ma10p', 
-        'web-dl', 'bdrip', 'webrip', 'big5', 'hi10p', 'aac', 'avc', 'web', 'multisub', 'multi-subs','1080','1920'
-    ]
-    
-    # 3. 修剪原文件名的技术词
-    def remove_technical_keywords_and_noise(text: str):
-        # 移除 [8位字母数字] 的部分
-        text = re.sub(r'\[[a-zA-Z0-9]{8}\]', '', text)
-        # 移除技术词汇（忽略大小写）
-        for keyword in technical_keywords:
-            text = re.sub(rf'{keyword}', '', text, flags=re.IGNORECASE)
-        # 替换空的方括号为 "[]"
-        text = re.sub(r'\[\s*\]', '[]', text)
-        # 清理多余的空格
-        text = re.sub(r'\s{2,}', ' ', text).strip()
-        return text
-
-    # 修剪后的原文件名
+    # 2. 修剪原文件名的技术词
     original_filename = remove_technical_keywords_and_noise(ori_filename)
 
-    # 4. 替换常见的分隔符为一个不常用的符号（仅在 `processed_filename` 中进行）
-    processed_filename = (
-        original_filename.replace('.', '|')
-        .replace('-', '|')
-        .replace('_', '|')
-        .replace('[', '|')
-        .replace(']', '|')
-        .replace('(', '|')
-        .replace(')', '|')
-        .replace('&', '|')
-        .replace('/', '|')  # 新增分隔符
-    )
-
-    # 5. 根据替换后的符号拆分文件名
+    # 3. 替换常见的分隔符为一个不常用的符号（仅在 `processed_filename` 中进行）
+    processed_filename = original_filename.translate(_SEP_TABLE)
+
+    # 4. 根据替换后的符号拆分文件名
     parts = processed_filename.split('|')
     
-    # 6. 去除技术词汇（忽略大小写）和空白片段
+    # 5. 去除技术词汇（忽略大小写）和空白片段
     parts = [
-        part.strip() for part in parts
-        if part.strip() and not any(keyword.lower() in part.lower() for keyword in technical_keywords)
+        stripped for part in parts
+        if (stripped := part.strip()) and not _TECH_RE.search(_lower(stripped))
     ]
     
     return original_filename, processed_filename, parts
 
 
+def _build_group_pattern(subtitle_groups: list):
+    """
+    将字幕组库合并为一个正则，用于判断文件名片段是否包含任意字幕组名（匹配到一个即停止）。
+
+    参数：
+    subtitle_groups (list): 字幕组库，包含字幕组名称
+
+    返回：
+    re.Pattern: 小写形式的合并正则
+    """
+    if not subtitle_groups:
+        return re.compile('(?!)')  # 字幕组库为空时不匹配任何内容
+    return re.compile('|'.join(re.escape(group.lower()) for group in subtitle_groups))
 
-def identify_subtitle_group(original_filename: str, parts: list, subtitle_groups: list):
+def identify_subtitle_group(original_filename: str, parts: list, subtitle_groups: list = None):
     """
     识别文件名中的字幕组名。
     
     参数：
     original_filename (str): 原始文件名
     parts (list): 通过预处理函数获得的文件名片段
-    subtitle_groups (list): 字幕组库，包含字幕组名称
+    subtitle_groups (list): 字幕组库，包含字幕组名称；默认使用预先处理好的示例字幕组库
     
     返回：
     str: 识别到的字幕组名
@@ -78,10 +158,15 @@ def identify_subtitle_group(original_filename: str, parts: list, subtitle_groups
     # 1. 尝试通过原始文件名进行字幕组匹配
     matched_groups = []
 
-    # 使用原始文件名检查字幕组是否匹配
-    for group in subtitle_groups:
+    # 使用原始文件名检查字幕组是否匹配（文件名只转换一次小写，字幕组名预先转换）
+    if subtitle_groups is None:
+        groups_lower = _GROUPS_LOWER
+    else:
+        groups_lower = [(group, group.lower()) for group in subtitle_groups]
+    filename_lower = original_filename.lower()
+    for group, group_lower in groups_lower:
         # 精确匹配字幕组名
-        if group.lower() in original_filename.lower():
+        if group_lower in filename_lower:
             matched_groups.append(group)
     
     # 如果匹配到多个字幕组，返回连接的字幕组名
@@ -95,7 +180,8 @@ def identify_subtitle_group(original_filename: str, parts: list, subtitle_groups
     # 2. 如果没有匹配到，尝试通过文件名片段中的关键词识别
     else:
         for part in parts:
-            if 'sub' in part.lower() or 'studio' in part.lower():
+            part_lower = part.lower()
+            if 'sub' in part_lower or 'studio' in part_lower:
                 return part.strip()  # 返回该片段作为字幕组名
     
      # 3. 如果没有匹配到字幕组，则返回片段中的第一个片段
@@ -115,10 +201,7 @@ def identify_season(original_filename: str):
     返回：
     str: 识别到的季数（例如 "01"）
     """
-    # 更新正则表达式，支持更灵活的季数格式
-    season_pattern = re.compile(r'([Ss]eason\s*(\d+)|[Ss](\d+))')  # 匹配 "Season 1", "S01", 或 "s2"
-    
-    match = season_pattern.search(original_filename)
+    match = _SEASON_RE.search(original_filename)
     if match:
         # 捕获数字部分
         season = match.group(2) or match.group(3)
@@ -127,39 +210,42 @@ def identify_season(original_filename: str):
     # 如果未找到季数，返回默认值
     return "01"
     
-def identify_anime_name(processed_parts: list, subtitle_groups: list):
+def identify_anime_name(processed_parts: list, subtitle_groups: list = None):
     """
     通过去除字幕组、季信息和集信息后，从文件名片段中识别动漫名。
     如果没有明确的动漫名候选，返回默认值“UnknownAnime”。
 
     参数：
     processed_parts (list): 通过预处理函数获得的文件名片段
-    subtitle_groups (list): 字幕组库，包含字幕组名称
+    subtitle_groups (list): 字幕组库，包含字幕组名称；默认使用预先处理好的示例字幕组库
 
     返回：
     str: 识别到的动漫名
     """
-    # 季信息和集信息正则模式
-    season_pattern = re.compile(r'\b([Ss]eason\s*(\d{1,2})|[Ss](\d{1,2}))\b', re.IGNORECASE)  # 匹配季信息，例如 "S2", "Season 02"
-    episode_pattern = re.compile(r'\b[Ee](p)?(\d{1,2})\b|\b(\d{1,2})\b', re.IGNORECASE)  # 匹配集信息，例如 "Ep10", "10"
-
     # 去除字幕组名称
+    group_pattern = _GROUPS_RE if subtitle_groups is None else _build_group_pattern(subtitle_groups)
     filtered_parts = [
         part for part in processed_parts
-        if not any(group.lower() in part.lower() for group in subtitle_groups)
+        if not group_pattern.search(part.lower())
     ]
 
     # 去除季信息和集信息，仅删除匹配部分
     cleaned_parts = [
-        episode_pattern.sub('', season_pattern.sub('', part)).strip() for part in filtered_parts
+        _remove_matches(_SEASON_OR_EP_RE, part).strip() for part in filtered_parts
     ]
 
     # 如果没有剩余片段，返回默认值
     if not cleaned_parts:
         return "UnknownAnime"
 
-    # 从剩余片段中选择最长的作为动漫名
-    anime_name = max(cleaned_parts, key=len)
+    # 从剩余片段中选择最长的作为动漫名（长度相同时取第一个）
+    anime_name = ''
+    max_length = -1
+    for part in cleaned_parts:
+        length = len(part)
+        if length > max_length:
+            max_length = length
+            anime_name = part
 
     return anime_name.strip()
     
@@ -173,101 +259,230 @@ def identify_episode(original_filename: str):
     返回：
     str: 识别到的集数（例如 "01"），如果未找到则返回 "00"
     """
-    # 定义集数的正则模式
-    episode_patterns = [
-        #re.compile(r'\bS\d{1,2}E(\d{1,2})\b', re.IGNORECASE),  # 匹配 "S01E09"，提取 "E09"
-        re.compile(r'E(p)?(\d{1,2})', re.IGNORECASE),      # 匹配 "Ep10", "E03"
-        re.compile(r'\b第(\d{1,2})话\b'),                      # 匹配 "第10话"
-        re.compile(r'\b(\d{1,2})-(\d{1,2})\b'),               # 匹配范围 "01-02"
-        re.compile(r'\b(\d{1,2})\b'),                         # 匹配纯数字 "01"
-    ]
-
-    # 遍历正则模式进行匹配
-    for pattern in episode_patterns:
-        for match in pattern.finditer(original_filename):
-            # 提取匹配的数字
-            if '-' in match.group(0):  # 处理范围，提取第一个数字
-                number = match.group(1)
-            else:
-                number = match.group(len(match.groups()))
-            
-            # 检查数字是否符合两位数的限制
-            if len(number) <= 2:
-                return number.zfill(2)
+    # 一次扫描文件名，记录每种格式第一次出现的集数（正则为小写形式，只返回数字，无需保留原大小写）
+    candidates = {}
+    for match in _EPISODE_RE.finditer(_lower(original_filename)):
+        kind = match.lastgroup
+        if kind == 'ep':
+            return match.group(kind).zfill(2)
+        candidates.setdefault(kind, match.group(kind))
+
+    # 按优先级返回集数（正则已限制数字不超过两位）
+    for kind in _EPISODE_PRIORITY:
+        if kind in candidates:
+            return candidates[kind].zfill(2)
 
     # 如果没有找到符合条件的集数，返回默认值
     return "01"
 
-def rename_files(input_path: str, subtitle_groups: list):
+def log(message: str):
+    """
+    缓冲输出一条日志，累计 _LOG_BATCH_SIZE 条后批量写入。
+
+    参数：
+    message (str): 日志内容
+    """
+    _log_buffer.append(message)
+    if len(_log_buffer) >= _LOG_BATCH_SIZE:
+        flush_log()
+
+def flush_log():
+    """
+    将缓冲区中的日志一次性写入 stdout。
+    """
+    if _log_buffer:
+        sys.stdout.write('\n'.join(_log_buffer) + '\n')
+        sys.stdout.flush()
+        _log_buffer.clear()
+
+def iter_files(folder: str):
+    """
+    使用 os.scandir 递归遍历文件夹（顺序与 os.walk 相同），逐个生成文件信息。
+    DirEntry 自带文件名、路径和类型缓存，避免额外的 stat 调用和路径拼接/拆分。
+
+    参数：
+    folder (str): 文件夹路径
+
+    返回：
+    generator: (文件所在文件夹, 文件名, 文件路径)
+    """
+    try:
+        # 先读取完整的目录列表，避免重命名过程中修改正在遍历的目录
+        with os.scandir(folder) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subfolders = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            # 与 os.walk 一致，不进入符号链接指向的文件夹
+            if not entry.is_symlink():
+                subfolders.append(entry.path)
+        else:
+            yield folder, entry.name, entry.path
+
+    for subfolder in subfolders:
+        yield from iter_files(subfolder)
+
+def rename_files(input_path: str, subtitle_groups: list = None, quiet: bool = False):
     """
     递归处理多层文件夹中的文件，支持按文件夹层级缓存动漫信息。
+    每个文件夹先依次识别所有文件的新文件名，再用线程池并行重命名。
     
     参数：
     input_path (str): 文件或文件夹路径
-    subtitle_groups (list): 字幕组库
-    """
-    if os.path.isfile(input_path):
-        # 如果是单个文件，则处理重命名
-        rename_file(input_path, subtitle_groups, cache={})
-    elif os.path.isdir(input_path):
-        # 如果是文件夹，则递归处理文件夹中的所有文件
-        folder_cache = {}  # 缓存当前文件夹中的识别结果
-        for root, dirs, files in os.walk(input_path):
-            # 每进入一个子文件夹清除缓存，确保每层独立处理
-            folder_cache.clear()
-            for file in files:
-                file_path = os.path.join(root, file)
-                rename_file(file_path, subtitle_groups, cache=folder_cache)
-    else:
-        print(f"无效的路径：{input_path}")
-
-def rename_file(file_path: str, subtitle_groups: list, cache: dict):
+    subtitle_groups (list): 字幕组库，默认使用预先处理好的示例字幕组库
+    quiet (bool): 为 True 时不输出重命名成功的信息，只输出失败信息
     """
-    重命名单个文件，使用缓存避免重复识别动漫名、季数和字幕组。
+    try:
+        if os.path.isfile(input_path):
+            # 如果是单个文件，则处理重命名
+            file_dir, file_name = os.path.split(input_path)
+            rename_file(input_path, file_dir, file_name, subtitle_groups, cache={}, quiet=quiet)
+        elif os.path.isdir(input_path):
+            # 如果是文件夹，则递归处理文件夹中的所有文件（逐个生成，不预先收集文件列表）
+            with ThreadPoolExecutor(max_workers=_RENAME_WORKERS) as executor:
+                for file_dir, files in groupby(iter_files(input_path), key=itemgetter(0)):
+                    # 每个子文件夹使用独立的缓存，确保每层独立处理
+                    folder_cache = {}
+                    plans = [
+                        (file_path, build_new_path(file_dir, file_name, subtitle_groups, folder_cache))
+                        for _, file_name, file_path in files
+                    ]
+                    rename_batch(plans, executor, quiet=quiet)
+        else:
+            log(f"无效的路径：{input_path}")
+    finally:
+        # 输出缓冲区中剩余的日志
+        flush_log()
+
+def build_new_path(file_dir: str, file_name: str, subtitle_groups: list, cache: dict):
+    """
+    识别单个文件的动漫名、季数、集数和字幕组，构造新的文件路径。
+    使用缓存避免重复识别同一文件夹中的动漫名、季数和字幕组。
     
     参数：
-    file_path (str): 文件路径
-    subtitle_groups (list): 字幕组库
+    file_dir (str): 文件所在文件夹
+    file_name (str): 文件名
+    subtitle_groups (list): 字幕组库（None 表示使用示例字幕组库）
     cache (dict): 缓存同一路径的识别结果
-    """
-    # 获取文件名和扩展名
-    file_dir, file_name = os.path.split(file_path)
-    file_base, file_ext = os.path.splitext(file_name)
 
-    # 调用预处理函数
-    original_filename, processed_filename, processed_parts = preprocess_filename(file_base)
+    返回：
+    str: 新的文件路径
+    """
+    # 获取文件名和扩展名（与 os.path.splitext 相同，忽略开头的点）
+    dot = file_name.rfind('.')
+    if dot > 0 and file_name[:dot].lstrip('.'):
+        file_base, file_ext = file_name[:dot], file_name[dot:]
+    else:
+        file_base, file_ext = file_name, ''
 
-    # 如果当前路径已有缓存，则使用缓存值
-    if file_dir in cache:
-        anime_name = cache[file_dir]['anime_name']
-        season = cache[file_dir]['season']
-        subtitle_group = cache[file_dir]['subtitle_group']
+    # 如果当前路径已有缓存，则使用缓存值，只需轻量修剪文件名用于识别集数
+    cached = cache.get(file_dir)
+    if cached is not None:
+        original_filename = remove_technical_keywords_and_noise(file_base)
+        anime_name, season, subtitle_group = cached
     else:
+        # 调用预处理函数
+        original_filename, processed_filename, processed_parts = preprocess_filename(file_base)
+
         # 识别动漫名、季数和字幕组
         subtitle_group = identify_subtitle_group(file_name, processed_parts, subtitle_groups)
         season = identify_season(original_filename)
         anime_name = identify_anime_name(processed_parts, subtitle_groups)
         
-        # 缓存结果
-        cache[file_dir] = {
-            'anime_name': anime_name,
-            'season': season,
-            'subtitle_group': subtitle_group
-        }
+        # 缓存结果 (动漫名, 季数, 字幕组)
+        cache[file_dir] = (anime_name, season, subtitle_group)
 
     # 每个文件独立识别集数
     episode = identify_episode(original_filename)
 
     # 构造新文件名
     new_name = f"{anime_name} - S{season}E{episode} - {subtitle_group}{file_ext}"
-    new_path = os.path.join(file_dir, new_name)
+    return os.path.join(file_dir, new_name)
 
-    # 重命名文件
+def _rename(file_path: str, new_path: str):
+    """
+    重命名文件（使用 os.rename 而非 os.replace，Windows 上目标文件已存在时会失败而不是覆盖）。
+
+    参数：
+    file_path (str): 文件路径
+    new_path (str): 新的文件路径
+
+    返回：
+    OSError: 重命名失败时的错误，成功时为 None
+    """
     try:
         os.rename(file_path, new_path)
-        print(f"重命名成功：{file_path} -> {new_path}")
-    except Exception as e:
-        print(f"重命名失败：{file_path} -> {new_path}，错误：{e}")
+    except OSError as e:
+        return e
+    return None
+
+def _log_rename(file_path: str, new_path: str, error, quiet: bool):
+    """
+    输出单个文件的重命名结果。
+
+    参数：
+    file_path (str): 文件路径
+    new_path (str): 新的文件路径
+    error (OSError): 重命名失败时的错误，成功时为 None
+    quiet (bool): 为 True 时不输出重命名成功的信息
+    """
+    if error is not None:
+        log(f"重命名失败：{file_path} -> {new_path}，错误：{error}")
+    elif not quiet:
+        log(f"重命名成功：{file_path} -> {new_path}")
+
+def rename_batch(plans: list, executor, quiet: bool = False):
+    """
+    用线程池并行重命名同一文件夹中的文件（os.rename 会释放 GIL），按原顺序输出结果。
+    如果新文件名之间或与其他原文件名冲突，则按顺序重命名，保证结果与逐个处理时一致。
+
+    参数：
+    plans (list): [(文件路径, 新的文件路径), ...]
+    executor (ThreadPoolExecutor): 用于重命名的线程池
+    quiet (bool): 为 True 时不输出重命名成功的信息
+    """
+    # 按不区分大小写比较（os.path.normcase 在 macOS 上不转换大小写，而 APFS/HFS+ 通常不区分大小写）
+    sources = {os.path.normcase(file_path).casefold() for file_path, _ in plans}
+    targets = set()
+    conflict = False
+    for file_path, new_path in plans:
+        target = os.path.normcase(new_path).casefold()
+        if target in targets or (target in sources and target != os.path.normcase(file_path).casefold()):
+            conflict = True
+            break
+        targets.add(target)
+
+    if conflict or len(plans) < 2:
+        errors = (_rename(file_path, new_path) for file_path, new_path in plans)
+    else:
+        errors = executor.map(_rename, *zip(*plans))
+
+    # 日志只在主线程中按原顺序输出
+    for (file_path, new_path), error in zip(plans, errors):
+        _log_rename(file_path, new_path, error, quiet)
+
+def rename_file(file_path: str, file_dir: str, file_name: str, subtitle_groups: list, cache: dict, quiet: bool = False):
+    """
+    重命名单个文件，使用缓存避免重复识别动漫名、季数和字幕组。
+    
+    参数：
+    file_path (str): 文件路径
+    file_dir (str): 文件所在文件夹
+    file_name (str): 文件名
+    subtitle_groups (list): 字幕组库（None 表示使用示例字幕组库）
+    cache (dict): 缓存同一路径的识别结果
+    quiet (bool): 为 True 时不输出重命名成功的信息
+    """
+    new_path = build_new_path(file_dir, file_name, subtitle_groups, cache)
+    _log_rename(file_path, new_path, _rename(file_path, new_path), quiet)
 
 # 示例字幕组库
 subtitle_groups = ['VCB-Studio', 'Kamigami', 'FANSUB', 'UHA-WINGS', 'ReinForce', 'DMG', 'SweetSub', 'Nekomoe kissaten', 
@@ -275,12 +490,21 @@ subtitle_groups = ['VCB-Studio', 'Kamigami', 'FANSUB', 'UHA-WINGS', 'ReinForce',
                    'Fussoir', 'LittleBakas', '.subbers project', 'Lilith-Raws', 'NC-Raws', 'FLsnow','DHR', 'MakariHoshiyume', 
                    'TxxZ', 'A.I.R.nesSub','B-Global', '新Sub', 'XKsub', 'SumiSora','Mabors', 'UCCUSS','Skymoon-Raws']
 
+# 预先处理示例字幕组库，避免每个文件重复转换小写和构建正则
+_GROUPS_LOWER = [(group, group.lower()) for group in subtitle_groups]  # (字幕组名, 小写字幕组名)
+_GROUPS_RE = _build_group_pattern(subtitle_groups)
+
+
+# 检查是否有命令行参数传入（--quiet：不输出重命名成功的信息）
+args = sys.argv[1:]
+quiet = '--quiet' in args
+if quiet:
+    args.remove('--quiet')
 
-# 检查是否有命令行参数传入
-if len(sys.argv) > 1:
-    input_path = sys.argv[1]  # 获取拖动到脚本的路径
+if args:
+    input_path = args[0]  # 获取拖动到脚本的路径
 else:
     # 如果没有传入路径，则要求用户手动输入
     input_path = input("请输入文件或文件夹路径：").strip().strip('"')
 
-rename_files(input_path, subtitle_groups)
+rename_files(input_path, quiet=quiet)